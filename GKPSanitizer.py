@@ -14,11 +14,19 @@ GrayKey Password Sanitizer [GKPS]
 - Example of how to extend the spinner function for async/stream-based writing
 """
 
+import contextlib
+import mmap
+import multiprocessing
 import os
 import re
+import sys
 import time
-from itertools import cycle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from itertools import cycle, repeat
 import threading
+from typing import Optional
 
 DEFAULT_SOURCE_FILE       = "passwords.txt"
 DEFAULT_ITEM_VALUE_PREFIX = "Item value:"
@@ -28,6 +36,25 @@ DEFAULT_FILE_PREFIX_COMBO = "combolist"
 DEFAULT_MIN_LENGTH        = 4
 DEFAULT_MAX_LENGTH        = 64
 DEFAULT_MAX_NUMBER        = 99  # Number of possible "_00", "_01", ... output files
+DEFAULT_IO_BUFFER_SIZE    = 1 << 20  # 1 MiB read/write buffer for large GrayKey exports
+DEFAULT_WRITE_BATCH_SIZE  = 4096  # Output lines collected before each write
+DEFAULT_SCAN_WINDOW       = 64 << 20  # Bytes of the mapped source handed to the regex engine at once
+DEFAULT_MP_MIN_SIZE       = 256 << 20  # Smaller sources are scanned in a single process
+
+# Compiled once at import time; used for every account line of a combo list.
+# Applied with fullmatch(), which is cheaper than match() with ^...$ anchors.
+# In bytes patterns \s misses \x1c-\x1f, which str patterns treat as whitespace.
+_EMAIL_RE = re.compile(rb"[^@\s\x1c-\x1f]+@[^@\s\x1c-\x1f]+\.[^@\s\x1c-\x1f]+")
+_EMAIL_TEXT_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+# The ASCII characters str.strip() removes; bytes.strip() alone keeps \x1c-\x1f
+_ASCII_WHITESPACE = bytes(c for c in range(128) if chr(c).isspace())
+
+# A \r that does not start a \r\n line end (old Mac line ends)
+_LONE_CR_RE = re.compile(rb"\r(?!\n)")
+
+# Values starting with one of these look like JSON and are excluded
+_JSON_STARTS = (b'{"', b'[')
 
 def clear_screen():
     """
@@ -51,10 +78,16 @@ def print_header(title):
     print("=" * 60)
     print_blank_line()
 
-def display_countdown(seconds):
+def display_countdown(seconds, interactive=None):
     """
     Displays a countdown timer for the specified number of seconds.
+    Without a terminal (interactive defaults to sys.stdout.isatty()) nobody
+    reads the countdown, so it is skipped instead of delaying batch runs.
     """
+    if interactive is None:
+        interactive = sys.stdout.isatty()
+    if seconds <= 0 or not interactive:
+        return
     for i in range(seconds, 0, -1):
         print(f"Starting in {i} second(s)...", end="\r", flush=True)
         time.sleep(1)
@@ -68,9 +101,33 @@ def spinner_task(event):
     """
     spinner = cycle(['|', '/', '-', '\\'])
     while not event.is_set():
-        print_blank_line()
-        print(f"\rProcessing... {next(spinner)}", end="", flush=True)
-        time.sleep(0.1)
+        sys.stdout.write(f"\rProcessing... {next(spinner)}")
+        sys.stdout.flush()
+        # 4 Hz is enough for a spinner and wakes the thread (and takes the GIL) less often
+        event.wait(0.25)
+
+def start_spinner():
+    """
+    Starts spinner_task in a background thread, but only if stdout is a
+    terminal; redirected output (log files, CI) gets no spinner at all.
+
+    Returns:
+        (stop_event, spinner_thread), where spinner_thread is None without a terminal
+    """
+    stop_event = threading.Event()
+    spinner_thread = None
+    if sys.stdout.isatty():
+        spinner_thread = threading.Thread(target=spinner_task, args=(stop_event,))
+        spinner_thread.start()
+    return stop_event, spinner_thread
+
+def stop_spinner(stop_event, spinner_thread):
+    """
+    Stops a spinner started with start_spinner and waits for its thread.
+    """
+    stop_event.set()
+    if spinner_thread is not None:
+        spinner_thread.join()
 
 def list_txt_files():
     """
@@ -83,12 +140,19 @@ def find_available_filename(base_name, max_number=DEFAULT_MAX_NUMBER):
     Finds an available filename with a numbered extension in the form:
     base_name_00.txt, base_name_01.txt, ..., base_name_XX.txt
 
+    The directory is listed once instead of probing every candidate with
+    os.path.exists(), which matters on network shares. Only the chosen name
+    is confirmed with os.path.exists(), since only the file system knows
+    whether it ignores case (Windows, macOS).
+
     Returns:
         The first available filename as a string, or None if none are available.
     """
+    with os.scandir('.') as entries:
+        existing = {os.path.normcase(entry.name) for entry in entries}
     for number in range(max_number + 1):
         new_name = f"{base_name}_{number:02d}.txt"
-        if not os.path.exists(new_name):
+        if os.path.normcase(new_name) not in existing and not os.path.exists(new_name):
             return new_name
     return None
 
@@ -107,20 +171,160 @@ def validate_input(prompt, default, min_value=None, max_value=None):
         except ValueError:
             print("Invalid input. Please try again.")
 
-def is_valid_email(email: str) -> bool:
+def is_valid_email(email) -> bool:
     """
-    Checks if the provided string looks like a valid email address.
+    Checks if the provided value (str, or raw undecoded bytes as used by the
+    processing functions) looks like a valid email address.
     A simple regex is used here for demonstration purposes.
     """
-    pattern = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
-    return bool(pattern.match(email))
+    if isinstance(email, bytes):
+        if email.isascii():
+            return _EMAIL_RE.fullmatch(email) is not None
+        email = email.decode('utf-8', 'surrogateescape')
+    return _EMAIL_TEXT_RE.fullmatch(email) is not None
+
+def strip_unicode_value(value: bytes) -> tuple[bytes, int]:
+    """
+    Strips a non-ASCII raw value the way str.strip() strips the decoded text,
+    which also removes Unicode whitespace such as NBSP that bytes.strip()
+    leaves in place. Undecodable bytes are kept as they are.
+
+    Returns:
+        (stripped_value, length in characters)
+    """
+    text = value.decode('utf-8', 'surrogateescape').strip()
+    return text.encode('utf-8', 'surrogateescape'), len(text)
+
+def flush_lines(output_file, lines: list) -> None:
+    """
+    Writes the collected lines (bytes, without line endings) in one call
+    and empties the list for the next batch.
+    """
+    if lines:
+        output_file.write(b"\n".join(lines) + b"\n")
+        lines.clear()
+
+def open_source_fd(source_file_path: str) -> int:
+    """
+    Opens the source file read-only as a raw OS file descriptor for
+    iter_lines_fast (binary mode on Windows, where it matters).
+    """
+    return os.open(source_file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+
+def iter_chunk_lines(chunks):
+    """
+    Yields the lines (bytes, without line endings) contained in an iterable
+    of consecutive byte chunks. As in text mode, \n, \r\n and a lone \r all
+    end a line. Each chunk is split with a single bytes.splitlines(); the
+    pieces of a line crossing chunk borders are collected and joined once,
+    so even a line spanning many chunks costs linear time.
+    """
+    pending = []
+    after_cr = False
+    for chunk in chunks:
+        lines = chunk.splitlines()
+        if after_cr and chunk.startswith(b"\n"):
+            # The \n of a \r\n split between two chunks ends no further line
+            del lines[0]
+        after_cr = chunk.endswith(b"\r")
+        # The last piece may be an incomplete line; keep it for the next chunk
+        tail = None if chunk.endswith((b"\n", b"\r")) else lines.pop()
+        if lines and pending:
+            pending.append(lines[0])
+            lines[0] = b"".join(pending)
+            pending = []
+        yield from lines
+        if tail is not None:
+            pending.append(tail)
+    if pending:
+        yield b"".join(pending)
+
+def iter_lines_fast(fd: int, chunk_size: int = DEFAULT_IO_BUFFER_SIZE):
+    """
+    Yields the lines read from a raw file descriptor, chunk_size bytes per
+    os.read() call, bypassing the buffered file object and its per-line
+    readline machinery. The caller owns and closes fd.
+    """
+    if hasattr(os, 'posix_fadvise'):
+        # Hint the page cache that the file is read front to back
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    return iter_chunk_lines(iter(lambda: os.read(fd, chunk_size), b""))
+
+def iter_data_lines(data: bytes, chunk_size: int = DEFAULT_IO_BUFFER_SIZE):
+    """
+    Yields the lines of already loaded file contents, chunk by chunk, so the
+    whole file is never split into one huge list at once.
+    """
+    return iter_chunk_lines(data[i:i + chunk_size] for i in range(0, len(data), chunk_size))
+
+def iter_scan_windows(buffer, start: int = 0, end: int = None, window_size: int = DEFAULT_SCAN_WINDOW):
+    """
+    Splits buffer[start:end] of a bytes-like buffer (e.g. an mmap) into
+    (start, end) windows of roughly window_size bytes. Every window ends right
+    after a newline (or at the end of the range), so no line is ever split
+    between two windows.
+    """
+    size = len(buffer) if end is None else end
+    while start < size:
+        newline = buffer.find(b"\n", min(start + window_size, size) - 1, size)
+        window_end = size if newline == -1 else newline + 1
+        yield start, window_end
+        start = window_end
+
+def compile_value_pattern(prefix: str, min_length: int = 0, line_ends: bytes = b"\r\n"):
+    """
+    Compiles the regex that captures everything after the first occurrence of
+    prefix up to the end of that line, i.e. the next byte out of line_ends.
+    Remainders shorter than min_length bytes are rejected inside the regex
+    engine: a value of min_length characters needs at least that many bytes,
+    even before stripping.
+    """
+    return re.compile(re.escape(prefix.encode('utf-8'))
+                      + rb"([^%s]{%d,})" % (re.escape(line_ends), max(int(min_length), 0)))
+
+def filter_passwords(values, min_length: int, max_length: int) -> list:
+    """
+    Strips a list of raw captured values and returns those passing the
+    length and JSON filters, in their original order.
+    """
+    passwords = []
+    for p in map(bytes.strip, values, repeat(_ASCII_WHITESPACE)):
+        # Length limits count characters, so only non-ASCII values need decoding
+        if p.isascii():
+            length = len(p)
+        else:
+            p, length = strip_unicode_value(p)
+        if min_length <= length <= max_length and not p.startswith(_JSON_STARTS):
+            passwords.append(p)
+    return passwords
+
+def iter_passwords(buffer, prefix: str, min_length: int, max_length: int, start: int = 0, end: int = None):
+    """
+    Yields the stripped prefix values (see compile_value_pattern) in
+    buffer[start:end] that pass the length and JSON filters, in source order
+    (duplicates included). findall() and map() extract and strip the values
+    in C, so only candidate passwords ever reach Python code, never raw lines.
+
+    Values only stop at \n by default, since the strip removes the \r of a
+    \r\n line end. Windows that also contain a lone \r, which text mode
+    treats as a line end too, use the slower pattern that stops at \r.
+    """
+    pattern = compile_value_pattern(prefix, min_length, b"\n")
+    cr_pattern = compile_value_pattern(prefix, min_length)
+    for window_start, window_end in iter_scan_windows(buffer, start, end):
+        if _LONE_CR_RE.search(buffer, window_start, window_end) is not None:
+            window_pattern = cr_pattern
+        else:
+            window_pattern = pattern
+        yield from filter_passwords(window_pattern.findall(buffer, window_start, window_end), min_length, max_length)
 
 def process_file_passwordlist(
     source_file_path: str,
     output_file_path: str,
     prefix: str,
     min_length: int,
-    max_length: int
+    max_length: int,
+    source_data: Optional[bytes] = None
 ) -> tuple[int, int]:
     """
     Processes the source file to extract unique passwords based on filters:
@@ -129,17 +333,167 @@ def process_file_passwordlist(
       - The password should not start with '{' or '[' (to avoid JSON-like data).
       - No duplicates are allowed in the final output.
 
+    The source is memory-mapped and scanned window by window with a single
+    compiled regex (see iter_passwords).
+
+    If source_data (the already loaded file contents, see load_source_data)
+    is given, it is scanned instead of reading source_file_path again.
+
     Returns:
         (unique_count, duplicate_count)
     """
+    # Not presized: set() takes no capacity hint, and growing it reuses cached hashes
     seen_passwords = set()
+    out_buf = []
     unique_count = 0
     duplicate_count = 0
 
     # Differentiated error handling for reading
+    if source_data is None:
+        try:
+            source_file = open(source_file_path, 'rb')
+        except FileNotFoundError:
+            print(f"Source file '{source_file_path}' was not found.")
+            return 0, 0
+        except PermissionError:
+            print(f"No permission to read from '{source_file_path}'.")
+            return 0, 0
+        except OSError as e:
+            print(f"OS error while reading '{source_file_path}': {e}")
+            return 0, 0
+
+    # The mapping lets the OS page the source in on demand; everything stays
+    # raw bytes and nothing is decoded on the hot path.
     try:
-        with open(source_file_path, 'r') as source_file:
-            lines = source_file.readlines()
+        with contextlib.ExitStack() as stack:
+            if source_data is None:
+                stack.enter_context(source_file)
+            output_file = stack.enter_context(open(output_file_path, 'wb', buffering=DEFAULT_IO_BUFFER_SIZE))
+            if source_data is not None:
+                source_buffer = source_data
+            elif os.fstat(source_file.fileno()).st_size == 0:
+                # Empty files cannot be memory-mapped
+                return 0, 0
+            else:
+                source_buffer = stack.enter_context(mmap.mmap(source_file.fileno(), 0, access=mmap.ACCESS_READ))
+            for password in iter_passwords(source_buffer, prefix, min_length, max_length):
+                if password not in seen_passwords:
+                    seen_passwords.add(password)
+                    out_buf.append(password)
+                    unique_count += 1
+                    if len(out_buf) >= DEFAULT_WRITE_BATCH_SIZE:
+                        flush_lines(output_file, out_buf)
+                else:
+                    duplicate_count += 1
+            flush_lines(output_file, out_buf)
+    except PermissionError:
+        print(f"No permission to write to '{output_file_path}'.")
+        return 0, 0
+    except OSError as e:
+        print(f"OS error while processing '{source_file_path}' -> '{output_file_path}': {e}")
+        return 0, 0
+
+    return unique_count, duplicate_count
+
+
+def scan_password_range(
+    source_file_path: str,
+    prefix: str,
+    min_length: int,
+    max_length: int,
+    start: int,
+    end: int
+) -> tuple[list, list, int]:
+    """
+    Worker for process_file_passwordlist_mp: maps only source[start:end] and
+    de-duplicates the passwords found there locally.
+
+    Returns:
+        (passwords, duplicate_count) with passwords in source order
+    """
+    seen_passwords = set()
+    passwords = []
+    duplicate_count = 0
+
+    # mmap offsets have to be a multiple of the allocation granularity
+    offset = start - start % mmap.ALLOCATIONGRANULARITY
+    with open(source_file_path, 'rb') as source_file, \
+            mmap.mmap(source_file.fileno(), end - offset, access=mmap.ACCESS_READ, offset=offset) as source_map:
+        for password in iter_passwords(source_map, prefix, min_length, max_length, start - offset, end - offset):
+            if password not in seen_passwords:
+                seen_passwords.add(password)
+                passwords.append(password)
+            else:
+                duplicate_count += 1
+
+    return passwords, duplicate_count
+
+def password_worker_count(workers: int = 0) -> int:
+    """
+    Resolves the worker count for process_file_passwordlist_mp: workers, or
+    one per CPU by default, capped at the 61 processes ProcessPoolExecutor
+    accepts on Windows.
+    """
+    workers = workers or os.cpu_count() or 1
+    if sys.platform == 'win32':
+        workers = min(workers, 61)
+    return workers
+
+def uses_password_workers(source_file_path: str, workers: int = 0) -> bool:
+    """
+    Tells whether process_file_passwordlist_mp with the same arguments splits
+    the source across worker processes (True) or falls back to a single
+    process (False). Workers read the file themselves, so loaded source data
+    is only worth passing in the latter case.
+    """
+    workers = password_worker_count(workers)
+    try:
+        source_size = os.path.getsize(source_file_path)
+    except OSError:
+        # Let the single-process path report the problem
+        return False
+    return workers >= 2 and source_size >= DEFAULT_MP_MIN_SIZE
+
+def process_file_passwordlist_mp(
+    source_file_path: str,
+    output_file_path: str,
+    prefix: str,
+    min_length: int,
+    max_length: int,
+    workers: int = 0,
+    source_data: Optional[bytes] = None
+) -> tuple[int, int]:
+    """
+    Multi-process variant of process_file_passwordlist with identical output.
+    The source is split into newline-aligned byte ranges, one per worker
+    (default: one per CPU). Each worker extracts and locally de-duplicates
+    its range (scan_password_range). The results are merged here in source
+    order, so the first occurrence of a password still wins.
+
+    Sources smaller than DEFAULT_MP_MIN_SIZE, or a single worker, fall back
+    to process_file_passwordlist (scanning source_data if given), since
+    starting processes would cost more than it saves. Workers always read
+    the file themselves; a recently cached file is served from the OS page
+    cache anyway.
+
+    Returns:
+        (unique_count, duplicate_count)
+    """
+    if not uses_password_workers(source_file_path, workers):
+        return process_file_passwordlist(source_file_path, output_file_path, prefix, min_length, max_length,
+                                         source_data=source_data)
+    workers = password_worker_count(workers)
+
+    seen_passwords = set()
+    out_buf = []
+    unique_count = 0
+    duplicate_count = 0
+
+    # Differentiated error handling for reading
+    try:
+        with open(source_file_path, 'rb') as source_file, \
+                mmap.mmap(source_file.fileno(), 0, access=mmap.ACCESS_READ) as source_map:
+            ranges = list(iter_scan_windows(source_map, window_size=-(-len(source_map) // workers)))
     except FileNotFoundError:
         print(f"Source file '{source_file_path}' was not found.")
         return 0, 0
@@ -150,128 +504,253 @@ def process_file_passwordlist(
         print(f"OS error while reading '{source_file_path}': {e}")
         return 0, 0
 
-    # Differentiated error handling for writing
     try:
-        with open(output_file_path, 'w') as output_file:
-            for line in lines:
-                if prefix in line:
-                    password = line.split(prefix, 1)[-1].strip()
-                    if (min_length <= len(password) <= max_length
-                            and not password.startswith('{"')
-                            and not password.startswith('[')):
-                        if password not in seen_passwords:
-                            output_file.write(password + "\n")
-                            seen_passwords.add(password)
-                            unique_count += 1
-                        else:
-                            duplicate_count += 1
+        with open(output_file_path, 'wb', buffering=DEFAULT_IO_BUFFER_SIZE) as output_file, \
+                ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+            # map() yields the results strictly in range order, so the output keeps
+            # source order, and drops each one once it has been merged
+            starts, ends = zip(*ranges)
+            results = executor.map(
+                partial(scan_password_range, source_file_path, prefix, min_length, max_length), starts, ends)
+            for passwords, range_duplicates in results:
+                duplicate_count += range_duplicates
+                for password in passwords:
+                    if password not in seen_passwords:
+                        seen_passwords.add(password)
+                        out_buf.append(password)
+                        unique_count += 1
+                        if len(out_buf) >= DEFAULT_WRITE_BATCH_SIZE:
+                            flush_lines(output_file, out_buf)
+                    else:
+                        duplicate_count += 1
+            flush_lines(output_file, out_buf)
+    except BrokenProcessPool:
+        print(f"A worker process died while scanning '{source_file_path}' (out of memory?).")
+        return 0, 0
     except PermissionError:
         print(f"No permission to write to '{output_file_path}'.")
         return 0, 0
     except OSError as e:
-        print(f"OS error while writing '{output_file_path}': {e}")
+        print(f"OS error while processing '{source_file_path}' -> '{output_file_path}': {e}")
         return 0, 0
 
     return unique_count, duplicate_count
 
-
 def process_file_combolist(
     source_file_path: str,
     output_file_path: str,
     account_prefix: str,
     password_prefix: str,
     min_length: int,
-    max_length: int
+    max_length: int,
+    source_data: Optional[bytes] = None
 ) -> tuple[int, int]:
     """
     Processes the source file to create a combo list (email:password):
       - account_prefix, e.g., 'Account:', to extract an email from the remainder
       - password_prefix, e.g., 'Item value:', to extract the password from the remainder
       - Duplicates are filtered out, and JSON-like lines are excluded
+      - If source_data (the already loaded file contents) is given, it is used instead of reading the file
+
+    This is process_file_both with only the combo list enabled.
 
     Returns:
         (unique_count, duplicate_count)
     """
+    _, combo_counts = process_file_both(
+        source_file_path,
+        None,
+        output_file_path,
+        account_prefix,
+        password_prefix,
+        min_length,
+        max_length,
+        source_data=source_data
+    )
+    return combo_counts
+
+def process_file_both(
+    source_file_path: str,
+    pw_output_file_path: Optional[str],
+    combo_output_file_path: Optional[str],
+    account_prefix: str,
+    password_prefix: str,
+    min_length: int,
+    max_length: int,
+    source_data: Optional[bytes] = None
+) -> tuple[tuple[int, int], tuple[int, int]]:
+    """
+    Creates the password list and the combo list in a single pass over the
+    source file, with the same filters and output as process_file_passwordlist
+    and process_file_combolist. Either output path may be None to skip that list.
+    If source_data (the already loaded file contents) is given, it is used
+    instead of reading the file.
+
+    A line carrying account_prefix sets (or resets) the current email and
+    never forms a combo, but its password_prefix value, if any, still goes
+    into the password list.
+
+    Returns:
+        ((pw_unique_count, pw_duplicate_count), (combo_unique_count, combo_duplicate_count))
+    """
+    account_prefix_b = account_prefix.encode('utf-8')
+    password_prefix_b = password_prefix.encode('utf-8')
+    account_prefix_len = len(account_prefix_b)
+    password_prefix_len = len(password_prefix_b)
+    # Lines shorter than these cannot hold a usable password (min_length
+    # characters take at least min_length bytes) or any account line at all
+    # (even invalid ones reset the current email), so len() rejects them
+    # before any substring search
+    min_password_line = password_prefix_len + min_length
+    min_line = min(account_prefix_len, min_password_line)
+    seen_passwords = set()
     seen_combos = set()
-    unique_count = 0
-    duplicate_count = 0
+    pw_buf = []
+    combo_buf = []
+    pw_unique_count = pw_duplicate_count = 0
+    combo_unique_count = combo_duplicate_count = 0
     current_email = None
 
     # Differentiated error handling for reading
-    try:
-        with open(source_file_path, 'r') as source_file:
-            lines = source_file.readlines()
-    except FileNotFoundError:
-        print(f"Source file '{source_file_path}' was not found.")
-        return 0, 0
-    except PermissionError:
-        print(f"No permission to read from '{source_file_path}'.")
-        return 0, 0
-    except OSError as e:
-        print(f"OS error while reading '{source_file_path}': {e}")
-        return 0, 0
+    source_fd = None
+    if source_data is None:
+        try:
+            source_fd = open_source_fd(source_file_path)
+        except FileNotFoundError:
+            print(f"Source file '{source_file_path}' was not found.")
+            return (0, 0), (0, 0)
+        except PermissionError:
+            print(f"No permission to read from '{source_file_path}'.")
+            return (0, 0), (0, 0)
+        except OSError as e:
+            print(f"OS error while reading '{source_file_path}': {e}")
+            return (0, 0), (0, 0)
 
-    # Differentiated error handling for writing
+    # Lines are streamed from the source straight into the output files,
+    # so the whole source never has to be held in memory at once.
+    # Everything stays raw bytes; nothing is decoded on the hot path.
+    # bytes.find() both tests for a prefix and gives the offset to slice the value
+    # from, without the list and extra objects split() would allocate.
+    # Two find() calls measured faster than one (account|password) regex search.
     try:
-        with open(output_file_path, 'w') as output_file:
+        with contextlib.ExitStack() as stack:
+            if source_fd is not None:
+                stack.callback(os.close, source_fd)
+            pw_output_file = None
+            combo_output_file = None
+            if pw_output_file_path is not None:
+                pw_output_file = stack.enter_context(
+                    open(pw_output_file_path, 'wb', buffering=DEFAULT_IO_BUFFER_SIZE))
+            if combo_output_file_path is not None:
+                combo_output_file = stack.enter_context(
+                    open(combo_output_file_path, 'wb', buffering=DEFAULT_IO_BUFFER_SIZE))
+
+            lines = iter_lines_fast(source_fd) if source_fd is not None else iter_data_lines(source_data)
             for line in lines:
-                if account_prefix in line:
-                    email_candidate = line.split(account_prefix, 1)[-1].strip()
+                if len(line) < min_line:
+                    continue
+                index = line.find(account_prefix_b)
+                if index != -1:
+                    email_candidate = line[index + account_prefix_len:].strip(_ASCII_WHITESPACE)
+                    if not email_candidate.isascii():
+                        email_candidate, _ = strip_unicode_value(email_candidate)
                     if is_valid_email(email_candidate):
                         current_email = email_candidate
                     else:
                         current_email = None
-                elif password_prefix in line:
-                    password_candidate = line.split(password_prefix, 1)[-1].strip()
-                    if (current_email is not None
-                            and min_length <= len(password_candidate) <= max_length
-                            and not password_candidate.startswith('{"')
-                            and not password_candidate.startswith('[')):
-                        combo_line = f"{current_email}:{password_candidate}"
-                        if combo_line not in seen_combos:
-                            output_file.write(combo_line + "\n")
-                            seen_combos.add(combo_line)
-                            unique_count += 1
-                        else:
-                            duplicate_count += 1
-    except PermissionError:
-        print(f"No permission to write to '{output_file_path}'.")
-        return 0, 0
+                    if pw_output_file is None:
+                        continue
+                    # Account lines never form a combo
+                    email = None
+                elif combo_output_file is not None:
+                    email = current_email
+                else:
+                    email = None
+                if len(line) < min_password_line or (email is None and pw_output_file is None):
+                    # Passwords without a valid account cannot form a combo
+                    continue
+                index = line.find(password_prefix_b)
+                if index == -1:
+                    continue
+                password = line[index + password_prefix_len:].strip(_ASCII_WHITESPACE)
+                # Length limits count characters, so only non-ASCII values need decoding
+                if password.isascii():
+                    length = len(password)
+                else:
+                    password, length = strip_unicode_value(password)
+                if not min_length <= length <= max_length or password.startswith(_JSON_STARTS):
+                    continue
+
+                if pw_output_file is not None:
+                    if password not in seen_passwords:
+                        seen_passwords.add(password)
+                        pw_buf.append(password)
+                        pw_unique_count += 1
+                        if len(pw_buf) >= DEFAULT_WRITE_BATCH_SIZE:
+                            flush_lines(pw_output_file, pw_buf)
+                    else:
+                        pw_duplicate_count += 1
+
+                if email is not None:
+                    combo_line = email + b":" + password
+                    if combo_line not in seen_combos:
+                        seen_combos.add(combo_line)
+                        combo_buf.append(combo_line)
+                        combo_unique_count += 1
+                        if len(combo_buf) >= DEFAULT_WRITE_BATCH_SIZE:
+                            flush_lines(combo_output_file, combo_buf)
+                    else:
+                        combo_duplicate_count += 1
+
+            if pw_output_file is not None:
+                flush_lines(pw_output_file, pw_buf)
+            if combo_output_file is not None:
+                flush_lines(combo_output_file, combo_buf)
+    except PermissionError as e:
+        print(f"No permission to write to '{e.filename}'.")
+        return (0, 0), (0, 0)
     except OSError as e:
-        print(f"OS error while writing '{output_file_path}': {e}")
-        return 0, 0
+        print(f"OS error while processing '{source_file_path}': {e}")
+        return (0, 0), (0, 0)
 
-    return unique_count, duplicate_count
+    return (pw_unique_count, pw_duplicate_count), (combo_unique_count, combo_duplicate_count)
 
 def create_password_list_flow(
     source_file_path: str,
     prefix: str = DEFAULT_ITEM_VALUE_PREFIX,
     min_length: int = DEFAULT_MIN_LENGTH,
-    max_length: int = DEFAULT_MAX_LENGTH
+    max_length: int = DEFAULT_MAX_LENGTH,
+    source_cache: Optional[dict] = None
 ) -> None:
     """
     Orchestrates the creation of a pure password list.
     Starts a spinner, calls the processing function, and displays the results.
+    With a session source_cache (see load_source_data), the file is read
+    from disk only once per session, unless it is large enough to be split
+    across worker processes, which read it themselves.
     """
     output_filename = find_available_filename(DEFAULT_FILE_PREFIX_PW, max_number=DEFAULT_MAX_NUMBER)
     if not output_filename:
         print("Too many output files already exist. Please clean up the directory.")
         return
 
-    stop_event = threading.Event()
-    spinner_thread = threading.Thread(target=spinner_task, args=(stop_event,))
-    spinner_thread.start()
+    stop_event, spinner_thread = start_spinner()
 
     start_time = time.time()
-    unique_count, duplicate_count = process_file_passwordlist(
-        source_file_path,
-        output_filename,
-        prefix,
-        min_length,
-        max_length
-    )
-    stop_event.set()
-    spinner_thread.join()
+    try:
+        source_data = None
+        if source_cache is not None and not uses_password_workers(source_file_path):
+            source_data = load_source_data(source_file_path, source_cache)
+        unique_count, duplicate_count = process_file_passwordlist_mp(
+            source_file_path,
+            output_filename,
+            prefix,
+            min_length,
+            max_length,
+            source_data=source_data
+        )
+    finally:
+        stop_spinner(stop_event, spinner_thread)
     end_time = time.time()
 
     if unique_count > 0 or duplicate_count > 0:
@@ -287,32 +766,36 @@ def create_combolist_flow(
     account_prefix: str = DEFAULT_ACCOUNT_PREFIX,
     password_prefix: str = DEFAULT_ITEM_VALUE_PREFIX,
     min_length: int = DEFAULT_MIN_LENGTH,
-    max_length: int = DEFAULT_MAX_LENGTH
+    max_length: int = DEFAULT_MAX_LENGTH,
+    source_cache: Optional[dict] = None
 ) -> None:
     """
     Orchestrates the creation of a combo list (email:password).
     Starts a spinner, calls the processing function, and displays the results.
+    With a session source_cache (see load_source_data), the file is read
+    from disk only once per session.
     """
     output_filename = find_available_filename(DEFAULT_FILE_PREFIX_COMBO, max_number=DEFAULT_MAX_NUMBER)
     if not output_filename:
         print("Too many combolist files already exist. Please clean up the directory.")
         return
 
-    stop_event = threading.Event()
-    spinner_thread = threading.Thread(target=spinner_task, args=(stop_event,))
-    spinner_thread.start()
+    stop_event, spinner_thread = start_spinner()
 
     start_time = time.time()
-    unique_count, duplicate_count = process_file_combolist(
-        source_file_path,
-        output_filename,
-        account_prefix,
-        password_prefix,
-        min_length,
-        max_length
-    )
-    stop_event.set()
-    spinner_thread.join()
+    try:
+        source_data = load_source_data(source_file_path, source_cache) if source_cache is not None else None
+        unique_count, duplicate_count = process_file_combolist(
+            source_file_path,
+            output_filename,
+            account_prefix,
+            password_prefix,
+            min_length,
+            max_length,
+            source_data=source_data
+        )
+    finally:
+        stop_spinner(stop_event, spinner_thread)
     end_time = time.time()
 
     if unique_count > 0 or duplicate_count > 0:
@@ -323,6 +806,133 @@ def create_combolist_flow(
     else:
         print("\nNo valid email:password pairs were processed, or the file was not found.")
 
+def create_both_lists_flow(
+    source_file_path: str,
+    account_prefix: str = DEFAULT_ACCOUNT_PREFIX,
+    password_prefix: str = DEFAULT_ITEM_VALUE_PREFIX,
+    min_length: int = DEFAULT_MIN_LENGTH,
+    max_length: int = DEFAULT_MAX_LENGTH,
+    source_cache: Optional[dict] = None
+) -> None:
+    """
+    Orchestrates the creation of a password list and a combo list in one pass.
+    Starts a spinner, calls the processing function, and displays the results.
+    With a session source_cache (see load_source_data), the file is read
+    from disk only once per session.
+    """
+    pw_filename = find_available_filename(DEFAULT_FILE_PREFIX_PW, max_number=DEFAULT_MAX_NUMBER)
+    combo_filename = find_available_filename(DEFAULT_FILE_PREFIX_COMBO, max_number=DEFAULT_MAX_NUMBER)
+    if not pw_filename or not combo_filename:
+        print("Too many output files already exist. Please clean up the directory.")
+        return
+
+    stop_event, spinner_thread = start_spinner()
+
+    start_time = time.time()
+    try:
+        source_data = load_source_data(source_file_path, source_cache) if source_cache is not None else None
+        (pw_unique, pw_duplicates), (combo_unique, combo_duplicates) = process_file_both(
+            source_file_path,
+            pw_filename,
+            combo_filename,
+            account_prefix,
+            password_prefix,
+            min_length,
+            max_length,
+            source_data=source_data
+        )
+    finally:
+        stop_spinner(stop_event, spinner_thread)
+    end_time = time.time()
+
+    if pw_unique > 0 or pw_duplicates > 0:
+        print(f"\nResults have been saved to '{pw_filename}'.")
+        print(f"Number of unique passwords saved: {pw_unique}")
+        print(f"Number of duplicates encountered: {pw_duplicates}")
+    else:
+        print("\nNo passwords were processed, or the file was not found.")
+
+    if combo_unique > 0 or combo_duplicates > 0:
+        print(f"\nA combolist has been saved to '{combo_filename}'.")
+        print(f"Number of unique email:password pairs saved: {combo_unique}")
+        print(f"Number of duplicates encountered: {combo_duplicates}")
+    else:
+        print("\nNo valid email:password pairs were processed, or the file was not found.")
+
+    print(f"Processing time: {end_time - start_time:.2f} seconds.")
+
+def available_memory() -> Optional[int]:
+    """
+    Returns the currently available physical memory in bytes, or None if it
+    cannot be determined on this platform (standard library only). On Linux
+    this is MemAvailable, which includes the reclaimable page cache; free
+    memory alone drops right after a large file has been read.
+    """
+    if os.name == 'nt':
+        import ctypes
+
+        class MEMORYSTATUSEX(ctypes.Structure):
+            _fields_ = [
+                ("dwLength", ctypes.c_ulong),
+                ("dwMemoryLoad", ctypes.c_ulong),
+                ("ullTotalPhys", ctypes.c_ulonglong),
+                ("ullAvailPhys", ctypes.c_ulonglong),
+                ("ullTotalPageFile", ctypes.c_ulonglong),
+                ("ullAvailPageFile", ctypes.c_ulonglong),
+                ("ullTotalVirtual", ctypes.c_ulonglong),
+                ("ullAvailVirtual", ctypes.c_ulonglong),
+                ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+            ]
+
+        status = MEMORYSTATUSEX()
+        status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+        if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+            return status.ullAvailPhys
+        return None
+    try:
+        with open('/proc/meminfo', 'rb') as meminfo:
+            for line in meminfo:
+                if line.startswith(b'MemAvailable:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        return None
+
+def load_source_data(source_file_path: str, cache: dict) -> Optional[bytes]:
+    """
+    Returns the contents of the source file for the processing functions,
+    reading it only on first use in a session. The cache dict holds a single
+    file, keyed by path, size and modification time, so selecting another
+    file (or the file changing on disk) replaces it.
+
+    Files larger than a quarter of the available memory are not cached;
+    None is returned and the processors read the file from disk as usual.
+    """
+    try:
+        stat = os.stat(source_file_path)
+    except OSError:
+        # Let the processing functions report the problem
+        return None
+    key = (os.path.abspath(source_file_path), stat.st_size, stat.st_mtime_ns)
+    if cache.get('key') == key:
+        return cache['data']
+
+    cache.clear()
+    memory = available_memory()
+    if memory is None or stat.st_size > memory // 4:
+        return None
+    try:
+        with open(source_file_path, 'rb') as source_file:
+            data = source_file.read()
+    except OSError:
+        return None
+    cache['key'] = key
+    cache['data'] = data
+    return data
+
 def select_file():
     """
     Prompts the user to select a file or use the default (DEFAULT_SOURCE_FILE).
@@ -369,6 +979,9 @@ def main():
     """
     Main function to control the flow of the GrayKey Password Sanitizer.
     """
+    # Keeps the last processed source in memory, so running another list
+    # on the same file does not read it from disk again
+    source_cache = {}
     while True:
         try:
             print_header("GrayKey Password Sanitizer [GKPS] v0.0.1 by ot2i7ba")
@@ -383,11 +996,31 @@ def main():
             print_blank_line()
             print("[1] Create a Password List (only passwords)")
             print("[2] Create a Combo List (email:password)")
+            print("[3] Create both lists in a single pass")
             print_blank_line()
 
-            user_choice = input("Your choice [1/2]: ").strip()
+            user_choice = input("Your choice [1/2/3]: ").strip()
+
+            if user_choice == '3':
+                # Both lists, single pass over the source
+                print_blank_line()
+                print("You chose to create a password list and a combo list")
+                print_blank_line()
+                account_prefix = input(f"Enter the prefix for accounts (default: '{DEFAULT_ACCOUNT_PREFIX}'): ") or DEFAULT_ACCOUNT_PREFIX
+                password_prefix = input(f"Enter the prefix for passwords (default: '{DEFAULT_ITEM_VALUE_PREFIX}'): ") or DEFAULT_ITEM_VALUE_PREFIX
+                min_length = validate_input(f"Enter the minimum password length (default: {DEFAULT_MIN_LENGTH}): ", DEFAULT_MIN_LENGTH, min_value=1)
+                max_length = validate_input(f"Enter the maximum password length (default: {DEFAULT_MAX_LENGTH}): ", DEFAULT_MAX_LENGTH, min_value=min_length)
+
+                create_both_lists_flow(
+                    source_file_path,
+                    account_prefix=account_prefix,
+                    password_prefix=password_prefix,
+                    min_length=min_length,
+                    max_length=max_length,
+                    source_cache=source_cache
+                )
 
-            if user_choice == '2':
+            elif user_choice == '2':
                 # Combo list flow
                 print_blank_line()
                 print("You chose to create a combo list (email:password)")
@@ -402,7 +1035,8 @@ def main():
                     account_prefix=account_prefix,
                     password_prefix=password_prefix,
                     min_length=min_length,
-                    max_length=max_length
+                    max_length=max_length,
+                    source_cache=source_cache
                 )
 
             else:
@@ -418,7 +1052,8 @@ def main():
                     source_file_path,
                     prefix=prefix,
                     min_length=min_length,
-                    max_length=max_length
+                    max_length=max_length,
+                    source_cache=source_cache
                 )
 
             print_blank_line()
@@ -441,4 +1076,6 @@ def main():
             return
 
 if __name__ == "__main__":
+    # Required for the worker processes of a PyInstaller-frozen executable on Windows
+    multiprocessing.freeze_support()
     main()